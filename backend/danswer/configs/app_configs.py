@@ -146,6 +146,11 @@ GOOGLE_DRIVE_ONLY_ORG_PUBLIC = False
 FILE_CONNECTOR_TMP_STORAGE_PATH = os.environ.get(
     "FILE_CONNECTOR_TMP_STORAGE_PATH", "/home/file_connector_storage"
 )
+# Parsed file contents are cached here keyed by content hash so re-indexing
+# runs skip re-parsing files that have not changed
+FILE_CONNECTOR_PARSE_CACHE_PATH = os.environ.get(
+    "FILE_CONNECTOR_PARSE_CACHE_PATH", "/home/file_connector_storage/parse_cache"
+)
 
 # TODO these should be available for frontend configuration, via advanced options expandable
 WEB_CONNECTOR_IGNORED_CLASSES = os.environ.get(
@@ -1,19 +1,29 @@
 import csv  # type: ignore
+import hashlib
 import io
+import json
+import multiprocessing
 import os
+import re
+import threading
 import zipfile
+from collections import deque
+from collections.abc import Callable
 from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timezone
-from email.parser import Parser as EmailParser
+from email import policy
+from email.parser import BytesParser
 from pathlib import Path
 from typing import Any
 from typing import IO
 
-import docx2txt  # type: ignore
 import openpyxl  # type: ignore
-import pptx  # type: ignore
-from bs4 import BeautifulSoup
+from lxml import etree  # type: ignore
+from lxml import html as lxml_html  # type: ignore
 from sqlalchemy.orm import Session
 
 from danswer.configs.app_configs import INDEX_BATCH_SIZE
@@ -21,10 +31,15 @@ from danswer.configs.constants import DocumentSource
 from danswer.connectors.cross_connector_utils.file_utils import detect_encoding
 from danswer.connectors.cross_connector_utils.file_utils import load_files_from_zip
 from danswer.connectors.cross_connector_utils.file_utils import read_file
-from danswer.connectors.cross_connector_utils.file_utils import read_pdf_file
+from danswer.connectors.cross_connector_utils.file_utils import read_pdf_pages_pymupdf
 from danswer.connectors.cross_connector_utils.miscellaneous_utils import time_str_to_utc
+from danswer.connectors.file.utils import add_pdf_pass_to_cache_key
+from danswer.connectors.file.utils import build_parse_cache_key
 from danswer.connectors.file.utils import check_file_ext_is_valid
 from danswer.connectors.file.utils import get_file_ext
+from danswer.connectors.file.utils import load_cached_parse
+from danswer.connectors.file.utils import prune_parse_cache
+from danswer.connectors.file.utils import store_cached_parse
 from danswer.connectors.interfaces import GenerateDocumentsOutput
 from danswer.connectors.interfaces import LoadConnector
 from danswer.connectors.models import BasicExpertInfo
@@ -36,113 +51,296 @@ from danswer.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Cap on parse tasks queued ahead of the workers so a huge zip does not
+# materialize all of its members in memory at once
+_MAX_IN_FLIGHT_FACTOR = 4
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _parse_worker_count() -> int:
+    # sched_getaffinity respects cgroup CPU limits in containers where
+    # cpu_count reports the host's cores; it is not available on all
+    # platforms (e.g. macOS)
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _get_process_pool() -> ProcessPoolExecutor | None:
+    """Lazily creates a single shared parse pool. Spawning a fresh pool per
+    load_from_state call pays worker startup (100-500ms) every time and throws
+    away warm interpreter caches; forkserver workers additionally inherit the
+    heavy parser imports once instead of re-importing them per start.
+
+    Returns None when the current process is daemonic - indexing normally runs
+    inside daemonic worker processes (SimpleJobClient / dask nannies), which
+    are not allowed to spawn children - and callers parse in-process instead."""
+    if multiprocessing.current_process().daemon:
+        return None
+
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(
+                max_workers=_parse_worker_count(),
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _POOL
+
 
 def _read_files_and_metadata(
     file_name: str,
-    db_session: Session,
-) -> Iterator[tuple[str, IO, dict[str, Any]]]:
+    file_content: IO,
+) -> Iterator[tuple[str, str, IO, dict[str, Any], str | None]]:
     """Reads the file into IO, in the case of a zip file, yields each individual
-    file contained within, also includes the metadata dict if packaged in the zip"""
+    file contained within, also includes the metadata dict if packaged in the zip.
+    The extension is yielded alongside so downstream dispatch does not need to
+    re-split the file name.
+
+    For zip members, a parse-cache key derived from the member's CRC32 and size
+    (both already present in the zip central directory) is yielded so cache hits
+    skip decompression and hashing entirely; for other files the key is None and
+    is derived from a content hash later."""
     extension = get_file_ext(file_name)
     metadata: dict[str, Any] = {}
     directory_path = os.path.dirname(file_name)
 
-    file_content = get_default_file_store(db_session).read_file(file_name, mode="b")
+    if not isinstance(file_content, (io.BytesIO, io.BufferedReader)):
+        # parsers (docx2txt, csv, zipfile, etc.) issue many small reads; if the
+        # store hands back an unbuffered stream, coalesce them into 128 KiB reads
+        file_content = io.BufferedReader(file_content, buffer_size=128 * 1024)  # type: ignore
 
     if extension == ".zip":
         for file_info, file, metadata in load_files_from_zip(
             file_content, ignore_dirs=True
         ):
-            yield os.path.join(directory_path, file_info.filename), file, metadata
-    elif extension in [
-        ".txt",
-        ".md",
-        ".mdx",
-        ".pdf",
-        ".docx",
-        ".pptx",
-        ".xlsx",
-        ".csv",
-        ".eml",
-        ".epub",
-    ]:
-        yield file_name, file_content, metadata
+            # the member's metadata comes from .danswer_metadata.json, which
+            # can change without the member's own CRC changing - fold it into
+            # the key so metadata-only edits invalidate the cached Documents
+            metadata_digest = hashlib.sha256(
+                json.dumps(metadata, sort_keys=True).encode()
+            ).hexdigest()
+            member_cache_key = (
+                f"{file_name}::{file_info.filename}"
+                f"::{file_info.CRC:08x}::{file_info.file_size}"
+                f"::{metadata_digest}"
+            )
+            yield (
+                os.path.join(directory_path, file_info.filename),
+                get_file_ext(file_info.filename),
+                file,
+                metadata,
+                member_cache_key,
+            )
+    elif check_file_ext_is_valid(extension):
+        yield file_name, extension, file_content, metadata, None
     else:
         logger.warning(f"Skipping file '{file_name}' with extension '{extension}'")
 
 
+# Extractors yield (id_suffix, text) chunks - one per page/sheet/slide for the
+# formats that have a natural unit, a single (None, text) chunk otherwise - so
+# a huge file becomes many small Documents instead of one giant Section
+_ExtractedChunks = Iterator[tuple[str | None, str]]
+
+
+def _extract_pdf(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    for page_num, page_text in read_pdf_pages_pymupdf(
+        file=file, file_name=file_name, pdf_pass=pdf_pass
+    ):
+        yield f"p{page_num}", page_text
+
+
+_WORDPROCESSINGML_NAMESPACE = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+)
+
+
+def _extract_docx(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    # same approach as pptx: a docx is a zip, so read word/document.xml with
+    # lxml directly instead of docx2txt's pure-Python unzip + regex passes
+    with zipfile.ZipFile(file) as docx_zip:
+        with docx_zip.open("word/document.xml") as document_file:
+            document_tree = etree.parse(document_file)
+
+    # one line per w:p paragraph, mirroring docx2txt's output shape; only w:t
+    # elements hold display text - itertext() would also pick up w:instrText
+    # field codes and w:delText tracked-changes deletions
+    yield None, "\n".join(
+        "".join(
+            text_element.text or ""
+            for text_element in paragraph.iter(f"{{{_WORDPROCESSINGML_NAMESPACE}}}t")
+        )
+        for paragraph in document_tree.iter(f"{{{_WORDPROCESSINGML_NAMESPACE}}}p")
+    )
+
+
+_PPTX_SLIDE_NAME_PATTERN = re.compile(r"ppt/slides/slide(\d+)\.xml")
+_DRAWINGML_NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+}
+
+
+def _extract_pptx(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    # a pptx is a zip of per-slide XML; pulling the text runs out directly
+    # with an XPath (which runs in libxml2 C) skips python-pptx's per-shape /
+    # per-paragraph object model entirely
+    with zipfile.ZipFile(file) as pptx_zip:
+        slide_names = []
+        for member_name in pptx_zip.namelist():
+            match = _PPTX_SLIDE_NAME_PATTERN.fullmatch(member_name)
+            if match:
+                slide_names.append((int(match.group(1)), member_name))
+
+        for slide_number, member_name in sorted(slide_names):
+            with pptx_zip.open(member_name) as slide_file:
+                slide_tree = etree.parse(slide_file)
+            # runs within an a:p paragraph are just formatting splits, so they
+            # join with no separator (matching python-pptx's shape.text);
+            # only paragraph boundaries become newlines
+            slide_text = "\n".join(
+                "".join(
+                    paragraph.xpath(".//a:t/text()", namespaces=_DRAWINGML_NAMESPACES)
+                )
+                for paragraph in slide_tree.xpath(
+                    "//a:p", namespaces=_DRAWINGML_NAMESPACES
+                )
+            )
+            # emitted pre-stripped so the later Section-level strip() is a
+            # no-op instead of another full copy of the slide text
+            yield f"slide{slide_number}", f"Slide {slide_number}:\n{slide_text}"
+
+
+def _extract_xlsx(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    # read_only streams rows via a pull parser instead of materializing a
+    # cell object per cell, data_only swaps formulas for their cached values
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    for sheet_num, sheet in enumerate(workbook.worksheets):
+        # writerows iterates and serializes rows in C (_csv), replacing the
+        # per-row map(str, ...) + join Python loops in the old hot path
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(
+            sheet.iter_rows(min_row=1, values_only=True)
+        )
+        # trim the trailing newline inside the buffer so the later strip()
+        # does not have to re-copy the whole sheet string
+        if buffer.tell():
+            buffer.truncate(buffer.tell() - 1)
+        yield f"sheet{sheet_num}", buffer.getvalue()
+
+
+def _extract_csv(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    text_file = io.TextIOWrapper(file, encoding=detect_encoding(file))
+    # stream rows into one growing buffer rather than materializing every
+    # row as a joined string and then joining those again
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(csv.reader(text_file))
+    # trim the trailing newline inside the buffer so the later strip() does
+    # not have to re-copy the whole file string
+    if buffer.tell():
+        buffer.truncate(buffer.tell() - 1)
+    yield None, buffer.getvalue()
+
+
+def _extract_eml(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    # parsing the raw bytes skips the detect_encoding + TextIOWrapper pass, and
+    # under policy.default get_content() hands back already-decoded str
+    message = BytesParser(policy=policy.default).parse(file)
+
+    text_content = []
+    for part in message.walk():
+        if part.get_content_type() == "text/plain":
+            text_content.append(part.get_content())
+    yield None, "\n\n".join(text_content)
+
+
+def _extract_epub(
+    file: IO[Any], file_name: str, pdf_pass: str | None
+) -> _ExtractedChunks:
+    # ZipFile does many small seek+read pairs over the central directory and
+    # per-entry headers; against an in-memory buffer those are plain pointer
+    # moves instead of syscalls
+    epub_bytes = file.getvalue() if isinstance(file, io.BytesIO) else file.read()
+
+    with zipfile.ZipFile(io.BytesIO(epub_bytes)) as epub:
+        html_items = [
+            item
+            for item in epub.infolist()
+            if item.filename.endswith((".xhtml", ".html"))
+        ]
+
+    def _extract_html_text(item: zipfile.ZipInfo) -> str:
+        # a shared ZipFile is not safe for concurrent reads, so each thread
+        # opens its own over the shared immutable bytes (BytesIO does not copy
+        # until written); the zlib decompression releases the GIL and so
+        # genuinely runs in parallel, as does the lxml parse
+        with zipfile.ZipFile(io.BytesIO(epub_bytes)) as thread_epub:
+            html_bytes = thread_epub.read(item)
+        if not html_bytes.strip():
+            return ""
+        # text_content() concatenates all descendant text in libxml2 C,
+        # with no BeautifulSoup wrapper tree or Python-level walk
+        return lxml_html.fromstring(html_bytes).text_content()
+
+    with ThreadPoolExecutor(max_workers=4) as extractor:
+        text_content = list(extractor.map(_extract_html_text, html_items))
+    yield None, "\n\n".join(text_content)
+
+
+# Dispatch table for the plain-text extractors; extractors that also surface
+# in-file metadata (the generic text path) are handled separately below
+_EXTENSION_TO_EXTRACTOR: dict[
+    str, Callable[[IO[Any], str, str | None], _ExtractedChunks]
+] = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".pptx": _extract_pptx,
+    ".xlsx": _extract_xlsx,
+    ".csv": _extract_csv,
+    ".eml": _extract_eml,
+    ".epub": _extract_epub,
+}
+
+
 def _process_file(
     file_name: str,
     file: IO[Any],
     metadata: dict[str, Any] | None = None,
     pdf_pass: str | None = None,
-) -> list[Document]:
-    extension = get_file_ext(file_name)
+    extension: str | None = None,
+) -> Iterator[Document]:
+    """Yields one Document per natural chunk of the file (page, sheet, slide)
+    rather than one Document wrapping the full text, so peak memory stays
+    proportional to a chunk instead of to the largest file."""
+    if extension is None:
+        extension = get_file_ext(file_name)
     if not check_file_ext_is_valid(extension):
         logger.warning(f"Skipping file '{file_name}' with extension '{extension}'")
-        return []
+        return
 
     file_metadata: dict[str, Any] = {}
 
-    if extension == ".pdf":
-        file_content_raw = read_pdf_file(
-            file=file, file_name=file_name, pdf_pass=pdf_pass
-        )
-
-    elif extension == ".docx":
-        file_content_raw = docx2txt.process(file)
-
-    elif extension == ".pptx":
-        presentation = pptx.Presentation(file)
-        text_content = []
-        for slide_number, slide in enumerate(presentation.slides, start=1):
-            extracted_text = f"\nSlide {slide_number}:\n"
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    extracted_text += shape.text + "\n"
-
-            text_content.append(extracted_text)
-        file_content_raw = "\n\n".join(text_content)
-
-    elif extension == ".xlsx":
-        workbook = openpyxl.load_workbook(file)
-        text_content = []
-        for sheet in workbook.worksheets:
-            sheet_string = "\n".join(
-                ",".join(map(str, row))
-                for row in sheet.iter_rows(min_row=1, values_only=True)
-            )
-            text_content.append(sheet_string)
-        file_content_raw = "\n\n".join(text_content)
-
-    elif extension == ".csv":
-        text_file = io.TextIOWrapper(file, encoding=detect_encoding(file))
-        reader = csv.reader(text_file)
-        file_content_raw = "\n".join([",".join(row) for row in reader])
-
-    elif extension == ".eml":
-        text_file = io.TextIOWrapper(file, encoding=detect_encoding(file))
-        parser = EmailParser()
-        message = parser.parse(text_file)
-
-        text_content = []
-        for part in message.walk():
-            if part.get_content_type().startswith("text/plain"):
-                text_content.append(part.get_payload())
-        file_content_raw = "\n\n".join(text_content)
-
-    elif extension == ".epub":
-        with zipfile.ZipFile(file) as epub:
-            text_content = []
-            for item in epub.infolist():
-                if item.filename.endswith(".xhtml") or item.filename.endswith(".html"):
-                    with epub.open(item) as html_file:
-                        soup = BeautifulSoup(html_file, "html.parser")
-                        text_content.append(soup.get_text())
-            file_content_raw = "\n\n".join(text_content)
+    extractor = _EXTENSION_TO_EXTRACTOR.get(extension)
+    if extractor is not None:
+        extracted_chunks = extractor(file, file_name, pdf_pass)
     else:
         encoding = detect_encoding(file)
         file_content_raw, file_metadata = read_file(file, encoding=encoding)
+        extracted_chunks = iter([(None, file_content_raw)])
     all_metadata = {**metadata, **file_metadata} if metadata else file_metadata
 
     # If this is set, we will show this in the UI as the "name" of the file
@@ -184,22 +382,76 @@ def _process_file(
         else None
     )
 
-    return [
-        Document(
-            id=f"FILE_CONNECTOR__{file_name}",  # add a prefix to avoid conflicts with other connectors
-            sections=[
-                Section(link=all_metadata.get("link"), text=file_content_raw.strip())
-            ],
+    # add a prefix to avoid conflicts with other connectors
+    base_id = f"FILE_CONNECTOR__{file_name}"
+    semantic_identifier = file_display_name_override or os.path.basename(file_name)
+
+    chunks_yielded = 0
+    for id_suffix, chunk_text in extracted_chunks:
+        chunk_text = chunk_text.strip()
+        if not chunk_text:
+            continue
+
+        yield Document(
+            id=base_id if id_suffix is None else f"{base_id}__{id_suffix}",
+            sections=[Section(link=all_metadata.get("link"), text=chunk_text)],
             source=DocumentSource.FILE,
-            semantic_identifier=file_display_name_override
-            or os.path.basename(file_name),
+            semantic_identifier=semantic_identifier,
             doc_updated_at=final_time_updated,
             primary_owners=p_owners,
             secondary_owners=s_owners,
             # currently metadata just houses tags, other stuff like owners / updated at have dedicated fields
             metadata=metadata_tags,
         )
-    ]
+        chunks_yielded += 1
+
+    if not chunks_yielded:
+        # an unparsable/empty file still gets an empty Document so it stays
+        # discoverable by title, matching the previous behavior
+        yield Document(
+            id=base_id,
+            sections=[Section(link=all_metadata.get("link"), text="")],
+            source=DocumentSource.FILE,
+            semantic_identifier=semantic_identifier,
+            doc_updated_at=final_time_updated,
+            primary_owners=p_owners,
+            secondary_owners=s_owners,
+            metadata=metadata_tags,
+        )
+
+
+def _process_file_bytes(
+    file_name: str,
+    file_bytes: bytes,
+    metadata: dict[str, Any] | None = None,
+    pdf_pass: str | None = None,
+    extension: str | None = None,
+    cache_key: str | None = None,
+) -> list[Document]:
+    """Process a file from its raw bytes. Parsing is CPU-bound, so this is the
+    unit of work shipped to worker processes - bytes pickle cheaply while
+    DB-backed IO handles cannot cross process boundaries at all.
+
+    Results are cached on disk keyed by content hash (or a caller-provided key,
+    e.g. CRC-based for zip members), so re-indexing runs only pay the parse
+    cost for files whose bytes actually changed. Note this means an unchanged
+    file keeps the doc_updated_at from when it was first parsed."""
+    if cache_key is None:
+        file_extension = extension or get_file_ext(file_name)
+        cache_key = build_parse_cache_key(
+            file_name,
+            file_bytes,
+            pdf_pass if file_extension == ".pdf" else None,
+        )
+        cached_documents = load_cached_parse(cache_key)
+        if cached_documents is not None:
+            return cached_documents
+
+    documents = list(
+        _process_file(file_name, io.BytesIO(file_bytes), metadata, pdf_pass, extension)
+    )
+    store_cached_parse(cache_key, documents)
+    return documents
 
 
 class LocalFileConnector(LoadConnector):
@@ -218,24 +470,85 @@ class LocalFileConnector(LoadConnector):
 
     def load_from_state(self) -> GenerateDocumentsOutput:
         documents: list[Document] = []
+        max_in_flight = _MAX_IN_FLIGHT_FACTOR * _parse_worker_count()
+        in_flight: deque[Future[list[Document]]] = deque()
+        pool = _get_process_pool()
+        # age out cache entries for files that no longer get indexed
+        prune_parse_cache()
+
         with Session(get_sqlalchemy_engine()) as db_session:
-            for file_path in self.file_locations:
+            # one metadata query for all files instead of a round-trip apiece;
+            # contents stream one file at a time as the iterator is consumed
+            file_contents = get_default_file_store(db_session).read_files(
+                [str(file_path) for file_path in self.file_locations], mode="b"
+            )
+
+            for file_path, file_content in file_contents:
                 current_datetime = datetime.now(timezone.utc)
                 files = _read_files_and_metadata(
-                    file_name=str(file_path), db_session=db_session
+                    file_name=file_path, file_content=file_content
                 )
 
-                for file_name, file, metadata in files:
+                for file_name, extension, file, metadata, cache_key in files:
                     metadata["time_updated"] = metadata.get(
                         "time_updated", current_datetime
                     )
-                    documents.extend(
-                        _process_file(file_name, file, metadata, self.pdf_pass)
-                    )
 
-                    if len(documents) >= self.batch_size:
-                        yield documents
-                        documents = []
+                    # zip members carry a CRC-derived key, so the cache can be
+                    # consulted before the member is even decompressed; a
+                    # resolved Future keeps the drain order intact
+                    if cache_key is not None and extension == ".pdf":
+                        cache_key = add_pdf_pass_to_cache_key(cache_key, self.pdf_pass)
+                    cached_documents = (
+                        load_cached_parse(cache_key) if cache_key is not None else None
+                    )
+                    if cached_documents is not None:
+                        cached_future: Future[list[Document]] = Future()
+                        cached_future.set_result(cached_documents)
+                        in_flight.append(cached_future)
+                    elif pool is None:
+                        # no pool available (daemonic parent), parse in-process;
+                        # wrapping in a resolved Future keeps one drain path
+                        sync_future: Future[list[Document]] = Future()
+                        sync_future.set_result(
+                            _process_file_bytes(
+                                file_name,
+                                file.read(),
+                                metadata,
+                                self.pdf_pass,
+                                extension,
+                                cache_key,
+                            )
+                        )
+                        in_flight.append(sync_future)
+                    else:
+                        in_flight.append(
+                            pool.submit(
+                                _process_file_bytes,
+                                file_name,
+                                file.read(),
+                                metadata,
+                                self.pdf_pass,
+                                extension,
+                                cache_key,
+                            )
+                        )
+
+                    # Block on the oldest task once enough are queued, results
+                    # are drained in submission order to keep batches stable
+                    while len(in_flight) >= max_in_flight:
+                        documents.extend(in_flight.popleft().result())
+
+                        if len(documents) >= self.batch_size:
+                            yield documents
+                            documents = []
+
+            while in_flight:
+                documents.extend(in_flight.popleft().result())
+
+                if len(documents) >= self.batch_size:
+                    yield documents
+                    documents = []
 
             if documents:
                 yield documents
@@ -1,4 +1,6 @@
+import hashlib
 import os
+import pickle
 import shutil
 import time
 import uuid
@@ -6,21 +8,29 @@ from pathlib import Path
 from typing import Any
 from typing import IO
 
+from danswer.configs.app_configs import FILE_CONNECTOR_PARSE_CACHE_PATH
 from danswer.configs.app_configs import FILE_CONNECTOR_TMP_STORAGE_PATH
+from danswer.utils.logger import setup_logger
 
-_VALID_FILE_EXTENSIONS = [
-    ".txt",
-    ".zip",
-    ".pdf",
-    ".md",
-    ".mdx",
-    ".docx",
-    ".pptx",
-    ".xlsx",
-    ".csv",
-    ".eml",
-    ".epub",
-]
+logger = setup_logger()
+
+_PARSE_CACHE_MAX_AGE_HOURS = 24 * 7
+
+_VALID_FILE_EXTENSIONS = frozenset(
+    [
+        ".txt",
+        ".zip",
+        ".pdf",
+        ".md",
+        ".mdx",
+        ".docx",
+        ".pptx",
+        ".xlsx",
+        ".csv",
+        ".eml",
+        ".epub",
+    ]
+)
 
 
 def get_file_ext(file_path_or_name: str | Path) -> str:
@@ -49,7 +59,8 @@ def write_temp_files(
         extension = get_file_ext(file_name)
         if not check_file_ext_is_valid(extension):
             raise ValueError(
-                f"Invalid file extension for file: '{file_name}'. Must be one of {_VALID_FILE_EXTENSIONS}"
+                f"Invalid file extension for file: '{file_name}'. "
+                f"Must be one of {sorted(_VALID_FILE_EXTENSIONS)}"
             )
 
         file_path = file_location / file_name
@@ -64,3 +75,81 @@ def write_temp_files(
 
 def file_age_in_hours(filepath: str | Path) -> float:
     return (time.time() - os.path.getmtime(filepath)) / (60 * 60)
+
+
+def add_pdf_pass_to_cache_key(cache_key: str, pdf_pass: str | None) -> str:
+    """The parse of an encrypted pdf depends on the password, so a credential
+    change must invalidate any cached (possibly empty) parse of it."""
+    if pdf_pass is None:
+        return cache_key
+    return f"{cache_key}::{hashlib.sha256(pdf_pass.encode()).hexdigest()}"
+
+
+def build_parse_cache_key(
+    file_name: str, file_bytes: bytes, pdf_pass: str | None = None
+) -> str:
+    cache_key = f"{file_name}::{hashlib.sha256(file_bytes).hexdigest()}"
+    return add_pdf_pass_to_cache_key(cache_key, pdf_pass)
+
+
+def _parse_cache_path(cache_key: str) -> Path:
+    # cache keys embed file names which may contain path separators, so hash
+    # the whole key to get a flat, filesystem-safe name
+    return Path(FILE_CONNECTOR_PARSE_CACHE_PATH) / (
+        hashlib.sha256(cache_key.encode()).hexdigest() + ".pkl"
+    )
+
+
+def load_cached_parse(cache_key: str) -> Any | None:
+    """Returns the cached parse result for the key or None on a miss.
+    A corrupt/unreadable cache entry is treated as a miss."""
+    cache_path = _parse_cache_path(cache_key)
+    try:
+        with open(cache_path, "rb") as cache_file:
+            parse_result = pickle.load(cache_file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return None
+
+    try:
+        # refresh the mtime so entries still in use survive pruning
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+    return parse_result
+
+
+def store_cached_parse(cache_key: str, parse_result: Any) -> None:
+    """The cache is best-effort - an unwritable cache dir degrades to
+    re-parsing every run rather than failing the parse itself."""
+    try:
+        cache_path = _parse_cache_path(cache_key)
+        os.makedirs(cache_path.parent, exist_ok=True)
+        # write-then-rename so concurrent workers never see a partial entry
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump(parse_result, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        logger.warning(f"Failed to cache parse result for key '{cache_key}'")
+
+
+def prune_parse_cache(max_age_hours: float = _PARSE_CACHE_MAX_AGE_HOURS) -> None:
+    """Drops cache entries that have not been used recently. load_cached_parse
+    refreshes an entry's mtime on every hit, so only entries for deleted or
+    re-uploaded files age out."""
+    try:
+        cache_entries = os.listdir(FILE_CONNECTOR_PARSE_CACHE_PATH)
+    except OSError:
+        return
+
+    for cache_entry in cache_entries:
+        entry_path = os.path.join(FILE_CONNECTOR_PARSE_CACHE_PATH, cache_entry)
+        try:
+            if file_age_in_hours(entry_path) > max_age_hours:
+                os.remove(entry_path)
+        except OSError:
+            # racing another worker's prune/store is fine
+            continue
@@ -16,7 +16,7 @@ from office365.onedrive.sites.site import Site  # type: ignore
 from danswer.configs.app_configs import INDEX_BATCH_SIZE
 from danswer.configs.constants import DocumentSource
 from danswer.connectors.cross_connector_utils.file_utils import is_text_file_extension
-from danswer.connectors.cross_connector_utils.file_utils import read_pdf_file
+from danswer.connectors.cross_connector_utils.file_utils import read_pdf_file_pymupdf
 from danswer.connectors.interfaces import GenerateDocumentsOutput
 from danswer.connectors.interfaces import LoadConnector
 from danswer.connectors.interfaces import PollConnector
@@ -64,7 +64,7 @@ def get_text_from_docx_driveitem(driveitem_object: DriveItem) -> str:
 
 def get_text_from_pdf_driveitem(driveitem_object: DriveItem) -> str:
     file_content = driveitem_object.get_content().execute_query().value
-    file_text = read_pdf_file(
+    file_text = read_pdf_file_pymupdf(
         file=io.BytesIO(file_content), file_name=driveitem_object.name
     )
     return file_text
@@ -82,15 +82,19 @@ def get_text_from_pptx_driveitem(driveitem_object: DriveItem) -> str:
     with tempfile.NamedTemporaryFile() as temp:
         temp.write(pptx_stream.getvalue())
         presentation = pptx.Presentation(temp.name)
-        extracted_text = ""
+        # collect into a list and join once - repeated += on a str goes
+        # quadratic once the interpreter's in-place optimization stops applying
+        extracted_text_parts = []
         for slide_number, slide in enumerate(presentation.slides, start=1):
-            extracted_text += f"\nSlide {slide_number}:\n"
+            extracted_text_parts.append(f"\nSlide {slide_number}:\n")
 
             for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    extracted_text += shape.text + "\n"
+                shape_text = getattr(shape, "text", None)
+                if shape_text:
+                    extracted_text_parts.append(shape_text)
+                    extracted_text_parts.append("\n")
 
-        return extracted_text
+        return "".join(extracted_text_parts)
 
 
 class SharepointConnector(LoadConnector, PollConnector):
@@ -86,6 +86,19 @@ def get_pgfilestore_by_file_name(
     return pgfilestore
 
 
+def get_pgfilestores_by_file_names(
+    file_names: list[str],
+    db_session: Session,
+) -> list[PGFileStore]:
+    """Fetches the tracking rows for all the given files in one query rather
+    than one round-trip per file"""
+    return (
+        db_session.query(PGFileStore)
+        .filter(PGFileStore.file_name.in_(file_names))
+        .all()
+    )
+
+
 def delete_pgfilestore_by_file_name(
     file_name: str,
     db_session: Session,
@@ -1,5 +1,6 @@
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Iterator
 from typing import IO
 
 from sqlalchemy.orm import Session
@@ -8,6 +9,7 @@ from danswer.db.pg_file_store import create_populate_lobj
 from danswer.db.pg_file_store import delete_lobj_by_id
 from danswer.db.pg_file_store import delete_pgfilestore_by_file_name
 from danswer.db.pg_file_store import get_pgfilestore_by_file_name
+from danswer.db.pg_file_store import get_pgfilestores_by_file_names
 from danswer.db.pg_file_store import read_lobj
 from danswer.db.pg_file_store import upsert_pgfilestore
 
@@ -41,6 +43,22 @@ class FileStore(ABC):
             Contents of the file and metadata dict
         """
 
+    @abstractmethod
+    def read_files(
+        self, file_names: list[str], mode: str | None
+    ) -> Iterator[tuple[str, IO]]:
+        """
+        Read the contents of multiple files, batching the metadata lookup into
+        a single query where the backing store allows it. Contents are read
+        lazily, one file at a time, as the iterator is consumed
+
+        Parameters:
+        - file_names: Names of the files to read
+
+        Returns:
+            Iterator of (file name, file contents) pairs in the requested order
+        """
+
     @abstractmethod
     def delete_file(self, file_name: str) -> None:
         """
@@ -76,6 +94,27 @@ class PostgresBackedFileStore(FileStore):
             lobj_oid=file_record.lobj_oid, db_session=self.db_session, mode=mode
         )
 
+    def read_files(
+        self, file_names: list[str], mode: str | None = None
+    ) -> Iterator[tuple[str, IO]]:
+        file_records = get_pgfilestores_by_file_names(
+            file_names=file_names, db_session=self.db_session
+        )
+        records_by_name = {record.file_name: record for record in file_records}
+        missing = set(file_names) - set(records_by_name)
+        if missing:
+            raise RuntimeError(
+                f"Files by names {sorted(missing)} do not exist or were deleted"
+            )
+        # only the row lookup is batched; each large object is read lazily so
+        # at most one file's contents are held here at a time
+        for file_name in file_names:
+            yield file_name, read_lobj(
+                lobj_oid=records_by_name[file_name].lobj_oid,
+                db_session=self.db_session,
+                mode=mode,
+            )
+
     def delete_file(self, file_name: str) -> None:
         try:
             file_record = get_pgfilestore_by_file_name(
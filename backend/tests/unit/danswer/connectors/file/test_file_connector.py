@@ -0,0 +1,181 @@
+import io
+import zipfile
+
+import openpyxl  # type: ignore
+
+from danswer.connectors.file.connector import _extract_csv
+from danswer.connectors.file.connector import _extract_docx
+from danswer.connectors.file.connector import _extract_eml
+from danswer.connectors.file.connector import _extract_epub
+from danswer.connectors.file.connector import _extract_pptx
+from danswer.connectors.file.connector import _extract_xlsx
+from danswer.connectors.file.connector import _process_file
+
+
+def _build_zip(members: dict[str, str]) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+_DOCX_DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+    "<w:p><w:r><w:t>Hello</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>World</w:t></w:r></w:p>"
+    "</w:body>"
+    "</w:document>"
+)
+
+
+def _slide_xml(text: str) -> str:
+    return (
+        '<sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        f"<a:p><a:r><a:t>{text}</a:t></a:r></a:p>"
+        "</sld>"
+    )
+
+
+def test_extract_docx() -> None:
+    docx_file = _build_zip({"word/document.xml": _DOCX_DOCUMENT_XML})
+
+    chunks = list(_extract_docx(docx_file, "test.docx", None))
+
+    assert chunks == [(None, "Hello\nWorld")]
+
+
+def test_extract_docx_skips_field_codes_and_deleted_text() -> None:
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        "<w:body>"
+        "<w:p>"
+        '<w:r><w:instrText>HYPERLINK "https://example.com"</w:instrText></w:r>'
+        "<w:r><w:t>Visible</w:t></w:r>"
+        "<w:del><w:r><w:delText>deleted</w:delText></w:r></w:del>"
+        "</w:p>"
+        "</w:body>"
+        "</w:document>"
+    )
+    docx_file = _build_zip({"word/document.xml": document_xml})
+
+    chunks = list(_extract_docx(docx_file, "test.docx", None))
+
+    assert chunks == [(None, "Visible")]
+
+
+def test_extract_pptx_orders_slides_numerically() -> None:
+    pptx_file = _build_zip(
+        {
+            "ppt/slides/slide10.xml": _slide_xml("tenth"),
+            "ppt/slides/slide1.xml": _slide_xml("first"),
+            "ppt/slides/slide2.xml": _slide_xml("second"),
+        }
+    )
+
+    chunks = list(_extract_pptx(pptx_file, "test.pptx", None))
+
+    assert chunks == [
+        ("slide1", "Slide 1:\nfirst"),
+        ("slide2", "Slide 2:\nsecond"),
+        ("slide10", "Slide 10:\ntenth"),
+    ]
+
+
+def test_extract_pptx_joins_runs_within_paragraph() -> None:
+    slide = (
+        '<sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        "<a:p><a:r><a:t>Hello </a:t></a:r><a:r><a:t>world</a:t></a:r></a:p>"
+        "<a:p><a:r><a:t>Second paragraph</a:t></a:r></a:p>"
+        "</sld>"
+    )
+    pptx_file = _build_zip({"ppt/slides/slide1.xml": slide})
+
+    chunks = list(_extract_pptx(pptx_file, "test.pptx", None))
+
+    assert chunks == [("slide1", "Slide 1:\nHello world\nSecond paragraph")]
+
+
+def test_extract_xlsx() -> None:
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append([1, 2])
+    sheet.append(["a", "b"])
+    xlsx_file = io.BytesIO()
+    workbook.save(xlsx_file)
+    xlsx_file.seek(0)
+
+    chunks = list(_extract_xlsx(xlsx_file, "test.xlsx", None))
+
+    assert chunks == [("sheet0", "1,2\na,b")]
+
+
+def test_extract_csv() -> None:
+    csv_file = io.BytesIO(b"a,b\r\nc,d\r\n")
+
+    chunks = list(_extract_csv(csv_file, "test.csv", None))
+
+    assert chunks == [(None, "a,b\nc,d")]
+
+
+def test_extract_eml() -> None:
+    eml_file = io.BytesIO(
+        b"From: sender@example.com\r\n"
+        b"To: recipient@example.com\r\n"
+        b"Subject: Greetings\r\n"
+        b"Content-Type: text/plain\r\n"
+        b"\r\n"
+        b"Hello from the test suite\r\n"
+    )
+
+    chunks = list(_extract_eml(eml_file, "test.eml", None))
+
+    assert len(chunks) == 1
+    assert chunks[0][0] is None
+    assert chunks[0][1].strip() == "Hello from the test suite"
+
+
+def test_extract_epub() -> None:
+    epub_file = _build_zip(
+        {
+            "mimetype": "application/epub+zip",
+            "chapter1.xhtml": "<html><body><p>Chapter one text</p></body></html>",
+            "chapter2.html": "<html><body><p>Chapter two text</p></body></html>",
+        }
+    )
+
+    chunks = list(_extract_epub(epub_file, "test.epub", None))
+
+    assert len(chunks) == 1
+    assert chunks[0][0] is None
+    assert "Chapter one text" in chunks[0][1]
+    assert "Chapter two text" in chunks[0][1]
+
+
+def test_process_file_yields_per_slide_documents() -> None:
+    pptx_file = _build_zip(
+        {
+            "ppt/slides/slide1.xml": _slide_xml("first"),
+            "ppt/slides/slide2.xml": _slide_xml("second"),
+        }
+    )
+
+    documents = list(_process_file("deck.pptx", pptx_file))
+
+    assert [document.id for document in documents] == [
+        "FILE_CONNECTOR__deck.pptx__slide1",
+        "FILE_CONNECTOR__deck.pptx__slide2",
+    ]
+    assert documents[0].sections[0].text == "Slide 1:\nfirst"
+
+
+def test_process_file_empty_file_yields_fallback_document() -> None:
+    documents = list(_process_file("empty.txt", io.BytesIO(b"")))
+
+    assert len(documents) == 1
+    assert documents[0].id == "FILE_CONNECTOR__empty.txt"
+    assert documents[0].sections[0].text == ""